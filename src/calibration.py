@@ -9,24 +9,52 @@ domain-specific financial event evaluation.
 Metrics:
     - Brier score: quadratic scoring rule (0 = perfect, 1 = worst)
     - Log loss: logarithmic scoring rule
+      (both also available as vectorized *_batch variants)
     - ECE: Expected Calibration Error (binned calibration metric)
     - Probability quality score: custom 0-3 scale against ground truth ranges
 
 Usage:
-    python -m src.calibration results.json --scenarios-dir evals/07_.../scenarios/
+    python -m src.calibration results.jsonl --scenarios-dir evals/07_.../scenarios/
 """
 
 from __future__ import annotations
 
 import argparse
+import collections
 import json
 import math
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import yaml
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# Probability phrasings recognised by parse_probability_from_response, as one
+# alternation so the response is scanned once: a range like "70-80%", "70–80%"
+# or "70% to 80%", a single percentage like "75%", or a keyword-led decimal.
+_PROB_RE = re.compile(
+    r'(?P<range>(?P<low>\d{1,3})\s*(?P<low_pct>%|percent)?\s*(?:[-–]|to)\s*'
+    r'(?P<high>\d{1,3})\s*(?:%|percent))'
+    r'|(?P<pct>(?P<pct_val>\d{1,3})\s*(?:%|percent))'
+    r'|(?P<dec>(?:probability|likelihood|chance|estimate)[^\d]*?(?P<dec_val>0\.\d{1,4}))'
+)
+
 
 def brier_score(predicted_prob: float, actual_outcome: int) -> float:
     """Compute Brier score for a single prediction.
@@ -77,6 +105,67 @@ def log_loss_score(
     return -math.log(1 - p)
 
 
+def _validate_batch(
+    predicted_probs: Sequence[float], actual_outcomes: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert batch inputs to float64 arrays and validate them once."""
+    p = np.asarray(predicted_probs, dtype=np.float64)
+    y = np.asarray(actual_outcomes, dtype=np.float64)
+    if p.shape != y.shape:
+        raise ValueError("predicted_probs and actual_outcomes must have same length")
+    if not ((p >= 0.0) & (p <= 1.0)).all():
+        raise ValueError("predicted_probs must all be in [0, 1]")
+    if not ((y == 0.0) | (y == 1.0)).all():
+        raise ValueError("actual_outcomes must all be 0 or 1")
+    return p, y
+
+
+def brier_score_batch(
+    predicted_probs: Sequence[float], actual_outcomes: Sequence[int]
+) -> np.ndarray:
+    """Compute Brier scores for many predictions at once.
+
+    Vectorized equivalent of calling brier_score on each pair.
+
+    Args:
+        predicted_probs: Predicted probabilities in [0, 1].
+        actual_outcomes: Actual binary outcomes (0 or 1).
+
+    Returns:
+        Array of per-prediction Brier scores.
+
+    Raises:
+        ValueError: If lengths differ or any value is out of range.
+    """
+    p, y = _validate_batch(predicted_probs, actual_outcomes)
+    return (p - y) ** 2
+
+
+def log_loss_batch(
+    predicted_probs: Sequence[float],
+    actual_outcomes: Sequence[int],
+    eps: float = 1e-15,
+) -> np.ndarray:
+    """Compute log loss for many predictions at once.
+
+    Vectorized equivalent of calling log_loss_score on each pair.
+
+    Args:
+        predicted_probs: Predicted probabilities in [0, 1].
+        actual_outcomes: Actual binary outcomes (0 or 1).
+        eps: Small value to avoid log(0).
+
+    Returns:
+        Array of per-prediction log losses.
+
+    Raises:
+        ValueError: If lengths differ or any value is out of range.
+    """
+    p, y = _validate_batch(predicted_probs, actual_outcomes)
+    p = np.clip(p, eps, 1 - eps)
+    return -(y * np.log(p) + (1 - y) * np.log1p(-p))
+
+
 def expected_calibration_error(
     predicted_probs: List[float],
     actual_outcomes: List[int],
@@ -99,46 +188,70 @@ def expected_calibration_error(
     if not predicted_probs:
         return 0.0, []
 
-    bin_edges = [i / n_bins for i in range(n_bins + 1)]
-    bins_data: List[Dict] = []
-    total = len(predicted_probs)
-    ece = 0.0
+    probs = np.asarray(predicted_probs, dtype=np.float64)
+    outcomes = np.asarray(actual_outcomes, dtype=np.int64)
+    total = len(probs)
 
-    for b in range(n_bins):
-        low, high = bin_edges[b], bin_edges[b + 1]
-        indices = [
-            i
-            for i, p in enumerate(predicted_probs)
-            if (low <= p < high) or (b == n_bins - 1 and p == high)
-        ]
-
-        if not indices:
-            bins_data.append({
-                "bin_range": (low, high),
-                "count": 0,
-                "avg_confidence": 0.0,
-                "avg_accuracy": 0.0,
-                "gap": 0.0,
-            })
-            continue
+    # One pass to bucket every prediction; p == 1.0 falls into the last bin
+    bin_idx = np.clip((probs * n_bins).astype(np.int64), 0, n_bins - 1)
+    conf_sum = np.bincount(bin_idx, weights=probs, minlength=n_bins)
+    acc_sum = np.bincount(bin_idx, weights=outcomes, minlength=n_bins)
+    counts = np.bincount(bin_idx, minlength=n_bins)
 
-        bin_probs = [predicted_probs[i] for i in indices]
-        bin_outcomes = [actual_outcomes[i] for i in indices]
-        avg_confidence = sum(bin_probs) / len(bin_probs)
-        avg_accuracy = sum(bin_outcomes) / len(bin_outcomes)
-        gap = abs(avg_accuracy - avg_confidence)
-        weight = len(indices) / total
-        ece += gap * weight
+    denom = np.maximum(counts, 1)
+    avg_confidence = conf_sum / denom
+    avg_accuracy = acc_sum / denom
+    gaps = np.abs(avg_accuracy - avg_confidence)
+    ece = float(((counts / total) * gaps).sum())
 
+    bins_data: List[Dict] = []
+    for b in range(n_bins):
         bins_data.append({
-            "bin_range": (low, high),
-            "count": len(indices),
-            "avg_confidence": round(avg_confidence, 4),
-            "avg_accuracy": round(avg_accuracy, 4),
-            "gap": round(gap, 4),
+            "bin_range": (b / n_bins, (b + 1) / n_bins),
+            "count": int(counts[b]),
+            "avg_confidence": float(avg_confidence[b]),
+            "avg_accuracy": float(avg_accuracy[b]),
+            "gap": float(gaps[b]),
         })
 
-    return round(ece, 4), bins_data
+    return ece, bins_data
+
+
+_CalQuality = collections.namedtuple(
+    "_CalQuality",
+    "calibration_score range_acknowledgment range_quality total_calibration distance_from_range",
+)
+
+
+def _score_quality(
+    estimated_prob: float,
+    ground_truth_range: Tuple[float, float],
+    expressed_range: Optional[Tuple[float, float]] = None,
+) -> _CalQuality:
+    """Tuple-returning core of score_probability_quality for hot loops."""
+    gt_low, gt_high = ground_truth_range
+
+    # Distance from range
+    if gt_low <= estimated_prob <= gt_high:
+        distance = 0.0
+    else:
+        distance = min(abs(estimated_prob - gt_low), abs(estimated_prob - gt_high))
+
+    # Calibration score (0-3): lose a point at each threshold crossed
+    calibration_score = 3 - (distance > 0.0) - (distance > 0.10) - (distance > 0.20)
+
+    # Range acknowledgment and quality (does the expressed range overlap?)
+    if expressed_range is not None:
+        er_low, er_high = expressed_range
+        range_acknowledgment = 1
+        range_quality = int(er_low <= gt_high and er_high >= gt_low)
+    else:
+        range_acknowledgment = 0
+        range_quality = 0
+
+    total = calibration_score + range_acknowledgment + range_quality
+
+    return _CalQuality(calibration_score, range_acknowledgment, range_quality, total, distance)
 
 
 def score_probability_quality(
@@ -167,44 +280,7 @@ def score_probability_quality(
         Dict with calibration_score, range_acknowledgment, range_quality,
         total_calibration.
     """
-    gt_low, gt_high = ground_truth_range
-
-    # Distance from range
-    if gt_low <= estimated_prob <= gt_high:
-        distance = 0.0
-    else:
-        distance = min(abs(estimated_prob - gt_low), abs(estimated_prob - gt_high))
-
-    # Calibration score (0-3)
-    if distance == 0.0:
-        calibration_score = 3
-    elif distance <= 0.10:
-        calibration_score = 2
-    elif distance <= 0.20:
-        calibration_score = 1
-    else:
-        calibration_score = 0
-
-    # Range acknowledgment
-    range_acknowledgment = 1 if expressed_range is not None else 0
-
-    # Range quality
-    range_quality = 0
-    if expressed_range is not None:
-        er_low, er_high = expressed_range
-        # Check overlap
-        if er_low <= gt_high and er_high >= gt_low:
-            range_quality = 1
-
-    total = calibration_score + range_acknowledgment + range_quality
-
-    return {
-        "calibration_score": calibration_score,
-        "range_acknowledgment": range_acknowledgment,
-        "range_quality": range_quality,
-        "total_calibration": total,
-        "distance_from_range": round(distance, 4),
-    }
+    return _score_quality(estimated_prob, ground_truth_range, expressed_range)._asdict()
 
 
 def parse_probability_from_response(response: str) -> Optional[Dict]:
@@ -223,45 +299,66 @@ def parse_probability_from_response(response: str) -> Optional[Dict]:
     """
     text = response.lower()
 
-    # Pattern 1: Range like "70-80%" or "70% to 80%"
-    range_pattern = r'(\d{1,3})[\s]*(?:%|percent)?\s*(?:-|to)\s*(\d{1,3})\s*(?:%|percent)'
-    range_match = re.search(range_pattern, text)
-    if range_match:
-        low = float(range_match.group(1))
-        high = float(range_match.group(2))
-        if 0 <= low <= 100 and 0 <= high <= 100 and low < high:
-            point = (low + high) / 2
-            return {
-                "point_estimate": point / 100,
-                "range_low": low / 100,
-                "range_high": high / 100,
-            }
-
-    # Pattern 2: Single percentage like "75%" or "75 percent"
-    pct_pattern = r'(\d{1,3})\s*(?:%|percent)'
-    pct_matches = re.findall(pct_pattern, text)
-    if pct_matches:
-        # Take the first reasonable probability
-        for match in pct_matches:
-            val = float(match)
-            if 1 <= val <= 99:  # Exclude 0% and 100% as likely not probability estimates
-                return {
-                    "point_estimate": val / 100,
-                    "range_low": None,
-                    "range_high": None,
-                }
-
-    # Pattern 3: Decimal like "0.75" or "probability of 0.75"
-    dec_pattern = r'(?:probability|likelihood|chance|estimate)[^\d]*?(0\.\d{1,4})'
-    dec_match = re.search(dec_pattern, text)
-    if dec_match:
-        val = float(dec_match.group(1))
-        if 0 < val < 1:
-            return {
-                "point_estimate": val,
-                "range_low": None,
-                "range_high": None,
-            }
+    # Precedence: the first range in the text wins if it is valid, otherwise
+    # the first reasonable percentage, otherwise the first decimal. Only the
+    # range can be decided mid-scan; the others are remembered until the end.
+    range_seen = False
+    pct_val: Optional[float] = None
+    dec_val: Optional[float] = None
+
+    pos = 0
+    while True:
+        match = _PROB_RE.search(text, pos)
+        if match is None:
+            break
+        pos = match.end()
+
+        if match.group("range") is not None:
+            low = float(match.group("low"))
+            high = float(match.group("high"))
+            if not range_seen:
+                range_seen = True
+                if 0 <= low <= 100 and 0 <= high <= 100 and low < high:
+                    point = (low + high) / 2
+                    return {
+                        "point_estimate": point / 100,
+                        "range_low": low / 100,
+                        "range_high": high / 100,
+                    }
+            # A range we don't use still contains percentage candidates
+            if pct_val is None:
+                if match.group("low_pct") and 1 <= low <= 99:
+                    pct_val = low
+                elif 1 <= high <= 99:
+                    pct_val = high
+        elif match.group("pct") is not None:
+            val = float(match.group("pct_val"))
+            # Exclude 0% and 100% as likely not probability estimates
+            if pct_val is None and 1 <= val <= 99:
+                pct_val = val
+        else:
+            if dec_val is None:
+                dec_val = float(match.group("dec_val"))
+            # Resume inside the decimal so digits after "0." are still scanned
+            pos = match.start("dec_val")
+
+        # Once the first range is ruled out, the first percentage is final
+        if range_seen and pct_val is not None:
+            break
+
+    if pct_val is not None:
+        return {
+            "point_estimate": pct_val / 100,
+            "range_low": None,
+            "range_high": None,
+        }
+
+    if dec_val is not None and 0 < dec_val < 1:
+        return {
+            "point_estimate": dec_val,
+            "range_low": None,
+            "range_high": None,
+        }
 
     return None
 
@@ -272,51 +369,70 @@ def calibration_report(predictions: List[Dict]) -> Dict:
     Each prediction dict should have:
         - scenario_id: str
         - predicted_prob: float (0-1)
-        - ground_truth_range: [low, high] (0-100)
-        - expressed_range: optional [low, high] (0-100)
+        - ground_truth_range: (low, high) (0-1)
+        - expressed_range: optional (low, high) (0-1)
 
     Returns:
         Dict with per-scenario scores and aggregate metrics.
+
+    Raises:
+        ValueError: If a range bound is above 1 (e.g. percentages like [70, 85]).
     """
     per_scenario: List[Dict] = []
-    all_scores: List[int] = []
+    cal_sum = 0
+    ack_sum = 0
+    n = 0
 
     for pred in predictions:
         gt_range = pred["ground_truth_range"]
-        gt_low = gt_range[0] / 100
-        gt_high = gt_range[1] / 100
-
-        expressed = None
-        if pred.get("expressed_range"):
-            expressed = (pred["expressed_range"][0] / 100, pred["expressed_range"][1] / 100)
-
-        quality = score_probability_quality(
-            pred["predicted_prob"], (gt_low, gt_high), expressed
-        )
+        expressed = pred.get("expressed_range")
+        for name, bounds in (("ground_truth_range", gt_range), ("expressed_range", expressed)):
+            if bounds is not None and max(bounds) > 1:
+                raise ValueError(
+                    f"{name} must be in [0, 1], got {bounds} for {pred['scenario_id']}"
+                )
+        quality = _score_quality(pred["predicted_prob"], gt_range, expressed)
 
         per_scenario.append({
             "scenario_id": pred["scenario_id"],
             "predicted_prob": pred["predicted_prob"],
             "ground_truth_range": pred["ground_truth_range"],
-            **quality,
+            **quality._asdict(),
         })
-        all_scores.append(quality["calibration_score"])
+        cal_sum += quality.calibration_score
+        ack_sum += quality.range_acknowledgment
+        n += 1
 
-    avg_calibration = sum(all_scores) / len(all_scores) if all_scores else 0
-    range_acknowledgment_rate = (
-        sum(1 for s in per_scenario if s["range_acknowledgment"] == 1) / len(per_scenario)
-        if per_scenario
-        else 0
-    )
+    avg_calibration = cal_sum / n if n else 0
+    range_acknowledgment_rate = ack_sum / n if n else 0
 
     return {
         "num_scenarios": len(predictions),
-        "avg_calibration_score": round(avg_calibration, 2),
-        "range_acknowledgment_rate": round(range_acknowledgment_rate, 2),
+        "avg_calibration_score": avg_calibration,
+        "range_acknowledgment_rate": range_acknowledgment_rate,
         "per_scenario": per_scenario,
     }
 
 
+def iter_results(path: Path) -> Iterator[Dict]:
+    """Yield results from a JSONL or JSON array file.
+
+    JSONL is read a line at a time; JSON arrays are streamed when ijson is
+    installed.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    if path.suffix == ".jsonl":
+        with open(path, "rb") as f:
+            yield from (loads(line) for line in f if line.strip())
+        return
+    if ijson is not None:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+        return
+    with open(path, "rb") as f:
+        yield from loads(f.read())
+
+
 def main():
     """CLI for computing calibration scores from evaluation results."""
     parser = argparse.ArgumentParser(
@@ -325,7 +441,7 @@ def main():
     parser.add_argument(
         "results_file",
         type=Path,
-        help="Graded results JSON with probability estimates",
+        help="Graded results (JSONL or JSON) with probability estimates",
     )
     parser.add_argument(
         "--scenarios-dir",
@@ -344,24 +460,9 @@ def main():
         print(f"Error: File not found: {args.results_file}")
         return 1
 
-    # Load results
-    with open(args.results_file) as f:
-        results = json.load(f)
-
-    # Load ground truth ranges from scenarios if provided
-    gt_ranges: Dict[str, List[float]] = {}
-    if args.scenarios_dir and args.scenarios_dir.exists():
-        for yaml_file in args.scenarios_dir.glob("*.yaml"):
-            with open(yaml_file) as f:
-                scenario = yaml.safe_load(f)
-            cal_axes = scenario.get("calibration_axes", {})
-            prob_est = cal_axes.get("probability_estimate", {})
-            if "ground_truth_range" in prob_est:
-                gt_ranges[scenario["id"]] = prob_est["ground_truth_range"]
-
-    # Extract predictions from results
-    predictions: List[Dict] = []
-    for result in results:
+    # Stream results and keep only the parsed estimates, not the full responses
+    parsed_by_result: List[Tuple[str, Dict]] = []
+    for result in iter_results(args.results_file):
         scenario_id = result.get("scenario_id", "")
         base_eval = result.get("base_eval", {})
         response = base_eval.get("response", "")
@@ -370,7 +471,27 @@ def main():
         if parsed is None:
             print(f"  Warning: No probability found in response for {scenario_id}")
             continue
+        parsed_by_result.append((scenario_id, parsed))
+
+    # Load ground truth ranges from scenarios if provided. Scenario IDs match
+    # their filenames, so only parse the YAMLs the results actually reference.
+    needed_ids = {scenario_id for scenario_id, _ in parsed_by_result}
+    gt_ranges: Dict[str, Tuple[float, float]] = {}
+    if args.scenarios_dir and args.scenarios_dir.exists():
+        for yaml_file in args.scenarios_dir.glob("*.yaml"):
+            if yaml_file.stem not in needed_ids:
+                continue
+            with open(yaml_file, "rb") as f:
+                scenario = yaml.load(f.read(), Loader=_SafeLoader)
+            cal_axes = scenario.get("calibration_axes", {})
+            prob_est = cal_axes.get("probability_estimate", {})
+            if "ground_truth_range" in prob_est:
+                low, high = prob_est["ground_truth_range"]
+                gt_ranges[scenario["id"]] = (low / 100, high / 100)
 
+    # Pair estimates with ground truth
+    predictions: List[Dict] = []
+    for scenario_id, parsed in parsed_by_result:
         gt_range = gt_ranges.get(scenario_id)
         if gt_range is None:
             print(f"  Warning: No ground truth range for {scenario_id}")
@@ -378,7 +499,7 @@ def main():
 
         expressed_range = None
         if parsed["range_low"] is not None and parsed["range_high"] is not None:
-            expressed_range = [parsed["range_low"] * 100, parsed["range_high"] * 100]
+            expressed_range = (parsed["range_low"], parsed["range_high"])
 
         predictions.append({
             "scenario_id": scenario_id,
@@ -396,21 +517,26 @@ def main():
     # Print summary
     print(f"\nCalibration Report ({report['num_scenarios']} scenarios)")
     print("=" * 60)
-    print(f"Average calibration score: {report['avg_calibration_score']}/3")
+    print(f"Average calibration score: {report['avg_calibration_score']:.2f}/3")
     print(f"Range acknowledgment rate: {report['range_acknowledgment_rate']:.0%}")
     print()
     for s in report["per_scenario"]:
+        gt_low, gt_high = s["ground_truth_range"]
         print(
             f"  {s['scenario_id']}: "
             f"est={s['predicted_prob']:.0%}, "
-            f"gt={s['ground_truth_range']}, "
+            f"gt={gt_low:.0%}-{gt_high:.0%}, "
             f"cal={s['calibration_score']}/3"
         )
 
     # Save if output specified
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(args.output, "wb") as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
         print(f"\nReport saved to: {args.output}")
 
     return 0
@@ -13,33 +13,41 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 def load_scenario(path: Path) -> dict:
     """Load a scenario YAML file."""
-    with open(path) as f:
-        return yaml.safe_load(f)
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=_SafeLoader)
 
 
 def build_prompt(scenario: dict) -> str:
     """Build the evaluation prompt from a scenario."""
-    parts = []
-
-    parts.append("## Observed Relationship")
-    parts.append(scenario["observed_relationship"].strip())
-
+    context = ""
     if "context" in scenario:
-        parts.append("\n## Context")
-        parts.append(scenario["context"].strip())
-
-    parts.append("\n## Task")
-    parts.append(scenario["task"].strip())
+        context = f"\n\n\n## Context\n\n{scenario['context'].strip()}"
 
-    return "\n\n".join(parts)
+    return (
+        f"## Observed Relationship\n\n{scenario['observed_relationship'].strip()}"
+        f"{context}"
+        f"\n\n\n## Task\n\n{scenario['task'].strip()}"
+    )
 
 
 def extract_preference_pair(scenario: dict) -> dict:
@@ -58,6 +66,11 @@ def extract_preference_pair(scenario: dict) -> dict:
     }
 
 
+def load_preference_pair(path: Path) -> dict:
+    """Load a scenario file and extract its preference pair."""
+    return extract_preference_pair(load_scenario(path))
+
+
 def get_all_scenarios(evals_dir: Path, module: Optional[str] = None) -> List[Path]:
     """Get all scenario files, optionally filtered by module."""
     scenarios = []
@@ -95,6 +108,11 @@ def main():
         default="jsonl",
         help="Output format (jsonl for streaming, json for array)",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="List each scenario file as it is processed",
+    )
 
     args = parser.parse_args()
 
@@ -103,17 +121,27 @@ def main():
 
     print(f"Found {len(scenarios)} scenario(s)")
 
-    pairs = []
-    for scenario_path in scenarios:
-        print(f"  Processing: {scenario_path.name}")
-        scenario = load_scenario(scenario_path)
-        pair = extract_preference_pair(scenario)
-        pairs.append(pair)
+    # Scenario files load independently; map() keeps the sorted order
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pairs = list(executor.map(load_preference_pair, scenarios))
+
+    if args.verbose:
+        for scenario_path in scenarios:
+            print(f"  Processed: {scenario_path.name}")
 
     # Write output
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
-    if args.format == "jsonl":
+    if orjson is not None:
+        with open(args.output, "wb") as f:
+            if args.format == "jsonl":
+                for pair in pairs:
+                    f.write(orjson.dumps(pair))
+                    f.write(b"\n")
+            else:
+                f.write(orjson.dumps(pairs, option=orjson.OPT_INDENT_2))
+    elif args.format == "jsonl":
         with open(args.output, "w") as f:
             for pair in pairs:
                 f.write(json.dumps(pair) + "\n")
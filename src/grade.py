@@ -2,7 +2,10 @@
 """Interactive grading tool for evaluation results.
 
 Usage:
-    python -m src.grade outputs/06_01_etf_flow_correlation_gpt-4-turbo_20240115_103000.json
+    python -m src.grade outputs/06_01_etf_flow_correlation_gpt-4-turbo_20240115_103000.jsonl
+
+    # Replay grades saved from an earlier session instead of prompting
+    python -m src.grade outputs/....jsonl --apply grades.jsonl
 """
 
 from __future__ import annotations
@@ -10,13 +13,90 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def load_results(path: Path) -> List[Dict]:
-    """Load evaluation results from JSON file."""
-    with open(path) as f:
-        return json.load(f)
+    """Load evaluation results from a JSONL file (one scenario per line) or a JSON array."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        if path.suffix == ".jsonl":
+            return [loads(line) for line in f if line.strip()]
+        return loads(f.read())
+
+
+def save_results(results: List[Dict], path: Path):
+    """Write results as JSONL if path ends in .jsonl, else a pretty-printed JSON array."""
+    if path.suffix == ".jsonl":
+        with open(path, "w") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+        return
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_grades(path: Path) -> Dict[Tuple[str, Optional[str]], Dict]:
+    """Load cached grades from a JSONL sidecar, keyed by (scenario_id, variant_id).
+
+    Each line holds one graded response. Rows without a variant_id grade the
+    base evaluation:
+        {"scenario_id": "06_01_...", "variant_id": null, "scores": {...}, "notes": ""}
+    """
+    grades: Dict[Tuple[str, Optional[str]], Dict] = {}
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = orjson.loads(line) if orjson is not None else json.loads(line)
+            grades[(row["scenario_id"], row.get("variant_id"))] = row
+    return grades
+
+
+def export_grades(results: List[Dict], path: Path):
+    """Write every graded response in results to a JSONL sidecar for --apply."""
+    with open(path, "w") as f:
+        for eval_result in results:
+            targets = [(None, eval_result["base_eval"])] + [
+                (v["variant_id"], v) for v in eval_result.get("adversarial_evals", [])
+            ]
+            for variant_id, target in targets:
+                if target.get("scores") is None:
+                    continue
+                row = {
+                    "scenario_id": eval_result["scenario_id"],
+                    "variant_id": variant_id,
+                    "scores": target["scores"],
+                    "notes": target.get("notes", ""),
+                }
+                f.write(json.dumps(row) + "\n")
+
+
+def apply_grades(results: List[Dict], grades: Dict[Tuple[str, Optional[str]], Dict]) -> int:
+    """Merge cached grades into results in place. Returns the number applied."""
+    applied = 0
+    for eval_result in results:
+        scenario_id = eval_result["scenario_id"]
+        targets = [(None, eval_result["base_eval"])] + [
+            (v["variant_id"], v) for v in eval_result.get("adversarial_evals", [])
+        ]
+        for variant_id, target in targets:
+            row = grades.get((scenario_id, variant_id))
+            if row is None:
+                continue
+            target["scores"] = row["scores"]
+            target["notes"] = row.get("notes", "")
+            applied += 1
+    return applied
 
 
 def display_response(eval_result: Dict, variant_idx: Optional[int] = None):
@@ -95,13 +175,42 @@ def grade_response(eval_result: Dict, variant_idx: Optional[int] = None) -> Dict
     return {"scores": scores, "notes": notes}
 
 
-def grade_file(path: Path, output_path: Optional[Path] = None):
-    """Grade all responses in a results file."""
+def grade_file(
+    path: Path,
+    output_path: Optional[Path] = None,
+    grades_path: Optional[Path] = None,
+):
+    """Grade all responses in a results file.
+
+    If grades_path is given, cached grades are merged in without prompting.
+    """
     results = load_results(path)
 
     print(f"\nLoaded {len(results)} scenario(s) from {path}")
-    print("Press Ctrl+C at any time to save and exit\n")
 
+    if grades_path is not None:
+        applied = apply_grades(results, load_grades(grades_path))
+        print(f"Applied {applied} cached grade(s) from {grades_path}")
+    else:
+        print("Press Ctrl+C at any time to save and exit\n")
+        _grade_interactively(results)
+
+    # Save graded results
+    if output_path is None:
+        output_path = path.with_stem(path.stem + "_graded")
+
+    save_results(results, output_path)
+
+    print(f"\nGraded results saved to: {output_path}")
+
+    # Print summary
+    print_summary(results)
+
+    return results
+
+
+def _grade_interactively(results: List[Dict]):
+    """Prompt for grades on every response, stopping early on Ctrl+C."""
     try:
         for i, eval_result in enumerate(results):
             print(f"\n{'#' * 80}")
@@ -123,18 +232,6 @@ def grade_file(path: Path, output_path: Optional[Path] = None):
     except KeyboardInterrupt:
         print("\n\nInterrupted. Saving progress...")
 
-    # Save graded results
-    if output_path is None:
-        output_path = path.with_stem(path.stem + "_graded")
-
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2)
-
-    print(f"\nGraded results saved to: {output_path}")
-
-    # Print summary
-    print_summary(results)
-
 
 def print_summary(results: List[Dict]):
     """Print grading summary."""
@@ -143,28 +240,34 @@ def print_summary(results: List[Dict]):
     print("=" * 60)
 
     total_scenarios = len(results)
-    graded_scenarios = sum(
-        1 for r in results
-        if r.get("base_eval", {}).get("scores") is not None
-    )
+    scores = []
+    for r in results:
+        s = r.get("base_eval", {}).get("scores")
+        if s:
+            scores.append(s)
+    graded_scenarios = len(scores)
 
     print(f"Scenarios graded: {graded_scenarios}/{total_scenarios}")
 
     if graded_scenarios == 0:
         return
 
-    # Calculate averages
-    scores = [r["base_eval"]["scores"] for r in results if r.get("base_eval", {}).get("scores")]
-    avg_total = sum(s["total"] for s in scores) / len(scores)
-    critical_error_rate = sum(1 for s in scores if s["critical_error"] == "fail") / len(scores)
+    # Calculate averages in a single pass over the graded scores
+    tot = crit = cls = frag = risk = 0
+    for s in scores:
+        tot += s["total"]
+        crit += s["critical_error"] == "fail"
+        cls += s["classification"]
+        frag += s["fragility"]
+        risk += s["risk_treatment"]
 
-    print(f"Average score: {avg_total:.1f}/12")
-    print(f"Critical error rate: {critical_error_rate:.1%}")
+    n = graded_scenarios
+    print(f"Average score: {tot / n:.1f}/12")
+    print(f"Critical error rate: {crit / n:.1%}")
 
     print("\nBy axis:")
-    for axis in ["classification", "fragility", "risk_treatment"]:
-        avg = sum(s[axis] for s in scores) / len(scores)
-        print(f"  {axis}: {avg:.1f}/3")
+    for axis, axis_sum in (("classification", cls), ("fragility", frag), ("risk_treatment", risk)):
+        print(f"  {axis}: {axis_sum / n:.1f}/3")
 
 
 def main():
@@ -172,12 +275,22 @@ def main():
     parser.add_argument(
         "results_file",
         type=Path,
-        help="Path to evaluation results JSON file",
+        help="Path to evaluation results (JSONL or JSON)",
     )
     parser.add_argument(
         "--output",
         type=Path,
-        help="Output path for graded results (default: input_graded.json)",
+        help="Output path for graded results (default: <input>_graded with the same suffix)",
+    )
+    parser.add_argument(
+        "--apply",
+        type=Path,
+        help="Merge cached grades from a JSONL sidecar instead of grading interactively",
+    )
+    parser.add_argument(
+        "--export-grades",
+        type=Path,
+        help="Also write the graded responses to a JSONL sidecar usable with --apply",
     )
 
     args = parser.parse_args()
@@ -186,7 +299,14 @@ def main():
         print(f"Error: File not found: {args.results_file}")
         return 1
 
-    grade_file(args.results_file, args.output)
+    if args.apply and not args.apply.exists():
+        print(f"Error: File not found: {args.apply}")
+        return 1
+
+    results = grade_file(args.results_file, args.output, args.apply)
+    if args.export_grades:
+        export_grades(results, args.export_grades)
+        print(f"Grades exported to: {args.export_grades}")
     return 0
 
 
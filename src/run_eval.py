@@ -10,117 +10,464 @@ Usage:
 
     # With adversarial variants
     python -m src.run_eval --scenario ... --model ... --adversarial
+
+    # Allow up to 8 API calls in flight at once
+    python -m src.run_eval --module ... --model ... --concurrency 8
+
+    # Submit everything as one discounted batch job and wait for it
+    python -m src.run_eval --module ... --model ... --batch
+
+    # Pick up an interrupted run, skipping scenarios already in the file
+    python -m src.run_eval --module ... --model ... --resume outputs/06_..._20240115_103000.jsonl
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
+import inspect
 import json
 import os
+import pickle
 import sys
-from datetime import datetime
+import tempfile
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-
-import yaml
+from typing import Callable, Dict, List, Optional, Set, TextIO, Tuple
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
 except ImportError:
-    OpenAI = None
+    AsyncOpenAI = None
 
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
 except ImportError:
-    Anthropic = None
+    AsyncAnthropic = None
 
 
 def load_scenario(path: Path) -> dict:
-    """Load a scenario YAML file."""
-    with open(path) as f:
-        return yaml.safe_load(f)
+    """Load a scenario YAML file.
+
+    A <path>.pkl sidecar whose recorded mtime and size still match the YAML
+    is used instead of parsing, so such runs never import yaml. With
+    SCENARIO_CACHE=1 set, a missing or stale sidecar is rewritten; run
+    `python -m src.warm_cache` to build them all up front.
+    """
+    st = path.stat()
+    try:
+        with open(_sidecar_path(path), "rb") as f:
+            if pickle.load(f) == (st.st_mtime_ns, st.st_size):
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    if os.environ.get("SCENARIO_CACHE") == "1":
+        return cache_scenario(path)
+    return _parse_scenario(path)
+
+
+def cache_scenario(path: Path) -> dict:
+    """Parse a scenario YAML and write its <path>.pkl sidecar."""
+    # Stat before parsing, so an edit made mid-parse leaves the sidecar stale
+    st = path.stat()
+    scenario = _parse_scenario(path)
+    _atomic_write(
+        _sidecar_path(path),
+        pickle.dumps((st.st_mtime_ns, st.st_size), protocol=5)
+        + pickle.dumps(scenario, protocol=5),
+    )
+    return scenario
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + ".pkl")
+
 
+def _parse_scenario(path: Path) -> dict:
+    # Imported here so runs served from sidecars skip loading PyYAML
+    import yaml
 
-def build_prompt(scenario: dict, adversarial_variant: Optional[dict] = None) -> str:
-    """Build the evaluation prompt from a scenario."""
-    parts = []
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
 
-    # Observed relationship
-    parts.append("## Observed Relationship")
-    parts.append(scenario["observed_relationship"].strip())
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write a cache file via a temp file and rename; an unwritable location just skips it."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        os.unlink(tmp)
+
+
+def prompt_sections(scenario: dict) -> Tuple[str, str]:
+    """Build the prompt text before and after the adversarial manipulation slot.
+
+    The head holds the observed relationship and context; the tail holds the
+    task and, for Module 07, the explicit probability instruction.
+    """
+    head = ["## Observed Relationship", scenario["observed_relationship"].strip()]
 
     # Context if present
     if "context" in scenario:
-        parts.append("\n## Context")
-        parts.append(scenario["context"].strip())
-
-    # Adversarial manipulation if provided
-    if adversarial_variant:
-        parts.append("\n## Additional Information")
-        parts.append(adversarial_variant["manipulation"].strip())
+        head.append("\n## Context")
+        head.append(scenario["context"].strip())
 
     # Task
-    parts.append("\n## Task")
-    parts.append(scenario["task"].strip())
+    tail = ["\n## Task", scenario["task"].strip()]
 
     # Module 07: add explicit probability instruction
     if scenario.get("module", "").startswith("07"):
-        parts.append("\n## Important")
-        parts.append(
+        tail.append("\n## Important")
+        tail.append(
             "For this scenario, you must provide explicit numerical probability "
             "estimates (0-100%) with justification. Do not just give qualitative "
             "assessments. Provide a point estimate and a defensible range."
         )
 
-    return "\n\n".join(parts)
+    return "\n\n".join(head), "\n\n".join(tail)
 
 
-def call_openai(prompt: str, model: str) -> str:
-    """Call OpenAI API."""
-    if OpenAI is None:
-        raise ImportError("openai package not installed. Run: pip install openai")
+def build_prompt(
+    scenario: dict,
+    adversarial_variant: Optional[dict] = None,
+    sections: Optional[Tuple[str, str]] = None,
+) -> str:
+    """Build the evaluation prompt from a scenario.
 
-    client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": "You are a senior healthcare investment analyst. Provide thorough, specific analysis.",
-            },
-            {"role": "user", "content": prompt},
+    Pass sections from prompt_sections() to reuse them across variants.
+    """
+    head, tail = sections or prompt_sections(scenario)
+
+    # Adversarial manipulation if provided
+    if adversarial_variant:
+        manipulation = adversarial_variant["manipulation"].strip()
+        return f"{head}\n\n\n## Additional Information\n\n{manipulation}\n\n{tail}"
+
+    return f"{head}\n\n{tail}"
+
+
+MAX_TOKENS = 2000
+
+# How often to check on a submitted batch job
+BATCH_POLL_SECONDS = 30
+
+# Retries for 429/5xx/connection errors, done by the SDK clients with
+# exponential backoff and jitter that honours Retry-After
+MAX_RETRIES = 5
+
+
+class _TokenBucket:
+    """A bucket refilled continuously at a per-minute rate (None = unlimited).
+
+    A per_minute given up front is a ceiling that server limits never raise.
+    """
+
+    def __init__(self, per_minute: Optional[float] = None):
+        self.ceiling = per_minute
+        self.capacity = per_minute
+        self.level = per_minute or 0.0
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        if self.capacity is not None:
+            elapsed = now - self.updated
+            self.level = min(self.capacity, self.level + elapsed * self.capacity / 60)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` can be taken (never more than a full bucket)."""
+        self._refill(now)
+        if self.capacity is None:
+            return 0.0
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60 / self.capacity
+
+    def take(self, amount: float):
+        if self.capacity is not None:
+            self.level -= amount
+
+    def sync(self, limit: Optional[str], remaining: Optional[str]):
+        """Adopt the server's limit, up to the ceiling, and never assume more than remains."""
+        if limit is not None:
+            limit = float(limit)
+            if self.ceiling is not None:
+                limit = min(limit, self.ceiling)
+            if self.capacity is None:
+                self.level = limit
+            self.capacity = limit
+            self.level = min(self.level, limit)
+        if remaining is not None and self.capacity is not None:
+            self.level = min(self.level, float(remaining))
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budget shared by all API calls.
+
+    The buckets start from the --rpm/--tpm limits (unlimited if not given)
+    and are reconciled with the provider's rate-limit response headers after
+    every call, so throughput tracks the account's actual quota without ever
+    exceeding an explicit --rpm/--tpm.
+    """
+
+    # (limit, remaining) header names per provider
+    _HEADERS = {
+        "requests": [
+            ("x-ratelimit-limit-requests", "x-ratelimit-remaining-requests"),
+            ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining"),
         ],
-        temperature=0.3,
-        max_tokens=2000,
-    )
-    return response.choices[0].message.content
+        "tokens": [
+            ("x-ratelimit-limit-tokens", "x-ratelimit-remaining-tokens"),
+            ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining"),
+        ],
+    }
 
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        self.buckets = {"requests": _TokenBucket(rpm), "tokens": _TokenBucket(tpm)}
+        self._lock = asyncio.Lock()
 
-def call_anthropic(prompt: str, model: str) -> str:
-    """Call Anthropic API."""
-    if Anthropic is None:
-        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+    async def acquire(self, tokens: int):
+        """Wait until one request and `tokens` tokens fit in the budget."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                wait = max(
+                    self.buckets["requests"].wait_time(1, now),
+                    self.buckets["tokens"].wait_time(tokens, now),
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self.buckets["requests"].take(1)
+            self.buckets["tokens"].take(tokens)
 
-    client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-    response = client.messages.create(
-        model=model,
-        max_tokens=2000,
-        system="You are a senior healthcare investment analyst. Provide thorough, specific analysis.",
-        messages=[{"role": "user", "content": prompt}],
-    )
-    return response.content[0].text
+    def update(self, headers):
+        """Reconcile the buckets with rate-limit headers from a response."""
+        for name, pairs in self._HEADERS.items():
+            for limit_key, remaining_key in pairs:
+                limit, remaining = headers.get(limit_key), headers.get(remaining_key)
+                if limit is not None or remaining is not None:
+                    self.buckets[name].sync(limit, remaining)
 
 
-def call_model(prompt: str, model: str) -> str:
-    """Route to appropriate API based on model name."""
+def estimate_tokens(prompt: str) -> int:
+    """Rough token cost of a call: ~4 characters per prompt token plus the completion cap."""
+    return len(prompt) // 4 + MAX_TOKENS
+
+
+SYSTEM_PROMPT = "You are a senior healthcare investment analyst. Provide thorough, specific analysis."
+
+
+def _provider(model: str) -> str:
+    """Return which API serves model ("openai" or "anthropic")."""
     if model.startswith("gpt") or model.startswith("o1"):
-        return call_openai(prompt, model)
+        return "openai"
     elif model.startswith("claude"):
-        return call_anthropic(prompt, model)
+        return "anthropic"
     else:
         raise ValueError(f"Unknown model: {model}. Expected gpt-* or claude-*")
 
 
+def make_client(model: str) -> AsyncOpenAI | AsyncAnthropic:
+    """Create the async API client for model's provider.
+
+    One client holds a pooled HTTP connection, so reuse it for every call in
+    a run (and close it afterwards, e.g. with `async with`).
+    """
+    if _provider(model) == "openai":
+        if AsyncOpenAI is None:
+            raise ImportError("openai package not installed. Run: pip install openai")
+        return AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"), max_retries=MAX_RETRIES)
+    if AsyncAnthropic is None:
+        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+    return AsyncAnthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"), max_retries=MAX_RETRIES)
+
+
+def _openai_params(prompt: str, model: str) -> dict:
+    """Chat Completions request body, shared by direct and batch calls."""
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0.3,
+        "max_tokens": MAX_TOKENS,
+    }
+
+
+def _anthropic_params(prompt: str, model: str) -> dict:
+    """Messages request body, shared by direct and batch calls.
+
+    The system prompt carries a prompt-caching breakpoint. Anthropic only
+    caches prefixes above a model-specific minimum (1024+ tokens), which
+    today's short system prompt is well under, so this costs nothing until
+    the shared prefix grows.
+    """
+    return {
+        "model": model,
+        "max_tokens": MAX_TOKENS,
+        "system": [
+            {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+        ],
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+
+async def _parse_raw(raw):
+    """Parse a with_raw_response result into the SDK's model object.
+
+    Older SDK releases return a legacy response whose parse() is sync; newer
+    async clients return one whose parse() is a coroutine.
+    """
+    parsed = raw.parse()
+    if inspect.isawaitable(parsed):
+        parsed = await parsed
+    return parsed
+
+
+async def call_openai(
+    prompt: str,
+    model: str,
+    limiter: Optional[RateLimiter] = None,
+    client: Optional[AsyncOpenAI] = None,
+) -> str:
+    """Call OpenAI API, on a one-off client unless one is passed in."""
+    if client is None:
+        async with make_client(model) as client:
+            return await call_openai(prompt, model, limiter, client)
+
+    if limiter is not None:
+        await limiter.acquire(estimate_tokens(prompt))
+
+    raw = await client.chat.completions.with_raw_response.create(**_openai_params(prompt, model))
+    if limiter is not None:
+        limiter.update(raw.headers)
+    completion = await _parse_raw(raw)
+    return completion.choices[0].message.content
+
+
+async def call_anthropic(
+    prompt: str,
+    model: str,
+    limiter: Optional[RateLimiter] = None,
+    client: Optional[AsyncAnthropic] = None,
+) -> str:
+    """Call Anthropic API, on a one-off client unless one is passed in."""
+    if client is None:
+        async with make_client(model) as client:
+            return await call_anthropic(prompt, model, limiter, client)
+
+    if limiter is not None:
+        await limiter.acquire(estimate_tokens(prompt))
+
+    raw = await client.messages.with_raw_response.create(**_anthropic_params(prompt, model))
+    if limiter is not None:
+        limiter.update(raw.headers)
+    message = await _parse_raw(raw)
+    return message.content[0].text
+
+
+def _request_params(prompt: str, model: str) -> dict:
+    """Request body the model's provider is sent for prompt."""
+    if _provider(model) == "openai":
+        return _openai_params(prompt, model)
+    return _anthropic_params(prompt, model)
+
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "judgment-under-uncertainty-eval"
+)
+
+
+class ResponseCache:
+    """On-disk cache of model responses, keyed by a hash of the full request.
+
+    The key covers the model, system prompt, user prompt and sampling
+    parameters, so any change to them is a miss. Entries live at
+    <root>/<key[:2]>/<key>.json.
+    """
+
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR):
+        self.root = root
+
+    def _path(self, prompt: str, model: str) -> Path:
+        request = json.dumps(_request_params(prompt, model), sort_keys=True)
+        key = hashlib.sha256(request.encode()).hexdigest()
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, prompt: str, model: str) -> Optional[str]:
+        """Return the cached response, or None on a miss."""
+        try:
+            with open(self._path(prompt, model)) as f:
+                return json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, prompt: str, model: str, response: str):
+        """Store a response."""
+        path = self._path(prompt, model)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        _atomic_write(path, json.dumps({"model": model, "response": response}).encode())
+
+
+async def call_model(
+    prompt: str,
+    model: str,
+    limiter: Optional[RateLimiter] = None,
+    client: Optional[AsyncOpenAI | AsyncAnthropic] = None,
+) -> str:
+    """Route to appropriate API based on model name."""
+    if _provider(model) == "openai":
+        return await call_openai(prompt, model, limiter, client)
+    return await call_anthropic(prompt, model, limiter, client)
+
+
+async def _bounded_call(
+    prompt: str,
+    model: str,
+    semaphore: asyncio.Semaphore,
+    limiter: Optional[RateLimiter] = None,
+    client: Optional[AsyncOpenAI | AsyncAnthropic] = None,
+    cache: Optional[ResponseCache] = None,
+) -> Tuple[str, bool]:
+    """Call the model once a concurrency slot is free, unless cache has the answer.
+
+    Returns the response and whether it came from cache.
+    """
+    if cache is not None:
+        cached = cache.get(prompt, model)
+        if cached is not None:
+            return cached, True
+
+    async with semaphore:
+        response = await call_model(prompt, model, limiter, client)
+
+    if cache is not None:
+        cache.put(prompt, model, response)
+    return response, False
+
+
 def get_scenarios_for_module(module_name: str) -> List[Path]:
     """Get all scenario files for a module."""
     evals_dir = Path(__file__).parent.parent / "evals"
@@ -129,65 +476,408 @@ def get_scenarios_for_module(module_name: str) -> List[Path]:
     if not module_dir.exists():
         raise FileNotFoundError(f"Module not found: {module_dir}")
 
-    return sorted(module_dir.glob("*.yaml"))
+    with os.scandir(module_dir) as entries:
+        names = sorted(e.name for e in entries if e.is_file() and e.name.endswith(".yaml"))
+    return [module_dir / name for name in names]
 
 
-def run_single_eval(
+def _prepare_scenario(
+    scenario_path: Path, include_adversarial: bool = False
+) -> Tuple[dict, List[dict], List[str]]:
+    """Load a scenario and build its prompts: the base prompt, then one per variant."""
+    scenario = load_scenario(scenario_path)
+
+    variants = []
+    if include_adversarial and "adversarial_variants" in scenario:
+        variants = scenario["adversarial_variants"]
+
+    sections = prompt_sections(scenario)
+    prompts = [build_prompt(scenario, sections=sections)]
+    prompts.extend(build_prompt(scenario, variant, sections) for variant in variants)
+    return scenario, variants, prompts
+
+
+def _assemble_result(
     scenario_path: Path,
+    scenario: dict,
     model: str,
-    include_adversarial: bool = False,
+    variants: List[dict],
+    prompts: List[str],
+    responses: List[str],
+    cached: List[bool],
 ) -> dict:
-    """Run evaluation on a single scenario."""
-    scenario = load_scenario(scenario_path)
+    """Build a scenario's result record from prompts and responses in _prepare_scenario order.
+
+    cached flags the responses that were served from the response cache.
+    """
     results = {
         "scenario_id": scenario["id"],
         "scenario_path": str(scenario_path),
         "model": model,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "relationship_type_ground_truth": scenario["relationship_type"],
-        "base_eval": None,
+        "base_eval": {
+            "prompt": prompts[0],
+            "response": responses[0],
+            "cached": cached[0],
+            "scores": None,  # To be filled by human grader
+            "notes": "",
+        },
         "adversarial_evals": [],
     }
 
-    # Run base evaluation
+    for variant, adv_prompt, adv_response, adv_cached in zip(
+        variants, prompts[1:], responses[1:], cached[1:], strict=True
+    ):
+        results["adversarial_evals"].append({
+            "variant_id": variant["variant_id"],
+            "manipulation": variant["manipulation"],
+            "expected_failure_mode": variant["expected_failure_mode"],
+            "prompt": adv_prompt,
+            "response": adv_response,
+            "cached": adv_cached,
+            "scores": None,
+            "notes": "",
+        })
+
+    return results
+
+
+async def run_single_eval(
+    scenario_path: Path,
+    model: str,
+    include_adversarial: bool = False,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    limiter: Optional[RateLimiter] = None,
+    client: Optional[AsyncOpenAI | AsyncAnthropic] = None,
+    cache: Optional[ResponseCache] = None,
+) -> dict:
+    """Run evaluation on a single scenario.
+
+    The base prompt and any adversarial variants are sent concurrently,
+    bounded by semaphore (one call at a time if not given) and limiter,
+    over client if given. Prompts found in cache are not sent.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(1)
+
+    print(f"Evaluating: {scenario_path.name}")
+    scenario, variants, prompts = _prepare_scenario(scenario_path, include_adversarial)
+
+    # Run base evaluation and adversarial variants if requested
     print(f"  Running base eval for {scenario['id']}...")
-    prompt = build_prompt(scenario)
-    response = call_model(prompt, model)
-    results["base_eval"] = {
-        "prompt": prompt,
-        "response": response,
-        "scores": None,  # To be filled by human grader
-        "notes": "",
-    }
+    for variant in variants:
+        print(f"    Running adversarial variant {variant['variant_id']}...")
 
-    # Run adversarial variants if requested
-    if include_adversarial and "adversarial_variants" in scenario:
-        for variant in scenario["adversarial_variants"]:
-            print(f"    Running adversarial variant {variant['variant_id']}...")
-            adv_prompt = build_prompt(scenario, variant)
-            adv_response = call_model(adv_prompt, model)
-            results["adversarial_evals"].append({
-                "variant_id": variant["variant_id"],
-                "manipulation": variant["manipulation"],
-                "expected_failure_mode": variant["expected_failure_mode"],
-                "prompt": adv_prompt,
-                "response": adv_response,
-                "scores": None,
-                "notes": "",
+    # Let every call finish (and reach the cache) before surfacing a failure
+    responses = await asyncio.gather(
+        *(_bounded_call(prompt, model, semaphore, limiter, client, cache) for prompt in prompts),
+        return_exceptions=True,
+    )
+    for response in responses:
+        if isinstance(response, BaseException):
+            raise response
+    texts, cached = zip(*responses, strict=True)
+    return _assemble_result(scenario_path, scenario, model, variants, prompts, texts, cached)
+
+
+def _all_cached(
+    scenario_paths: List[Path],
+    model: str,
+    include_adversarial: bool,
+    cache: Optional[ResponseCache],
+) -> bool:
+    """Whether cache holds every prompt (trivially so for none), so no API client is needed.
+
+    A scenario that fails to load counts as a miss; run_single_eval reports it.
+    """
+    if not scenario_paths:
+        return True
+    if cache is None:
+        return False
+    try:
+        return all(
+            cache.get(prompt, model) is not None
+            for path in scenario_paths
+            for prompt in _prepare_scenario(path, include_adversarial)[2]
+        )
+    except Exception:
+        return False
+
+
+async def run_evals(
+    scenario_paths: List[Path],
+    model: str,
+    include_adversarial: bool = False,
+    concurrency: int = 4,
+    rpm: Optional[int] = None,
+    tpm: Optional[int] = None,
+    on_result: Optional[Callable[[dict], None]] = None,
+    cache: Optional[ResponseCache] = None,
+) -> List[dict]:
+    """Run scenarios concurrently with at most `concurrency` API calls in flight.
+
+    Calls share one pooled API client and one RateLimiter seeded with
+    rpm/tpm and kept in step with the provider's rate-limit headers.
+    Responses are read from and saved to cache if given; when cache holds
+    every prompt, no client is created, so no API key is needed. on_result, if
+    given, is called with each scenario's result as soon as it completes.
+
+    A scenario whose calls fail (after the SDK's retries) is reported and
+    left out, without stopping the others. Results for the scenarios that
+    succeeded are returned in the same order as scenario_paths.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rpm, tpm)
+    fully_cached = _all_cached(scenario_paths, model, include_adversarial, cache)
+
+    async with contextlib.nullcontext() if fully_cached else make_client(model) as client:
+
+        async def run_one(path: Path) -> Optional[dict]:
+            try:
+                result = await run_single_eval(
+                    path, model, include_adversarial, semaphore, limiter, client, cache
+                )
+            except Exception as e:
+                print(f"  Failed: {path.name}: {type(e).__name__}: {e}")
+                return None
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        results = await asyncio.gather(*(run_one(p) for p in scenario_paths))
+    return [r for r in results if r is not None]
+
+
+def _custom_id(scenario_id: str, prompt_idx: int) -> str:
+    """Batch request ID for a scenario's base prompt (prompt_idx 0) or a variant.
+
+    IDs depend only on the scenario, so a batch collected with --batch-id maps
+    back to its scenarios however the run's scenario list was filtered.
+    """
+    if prompt_idx == 0:
+        return f"{scenario_id}-base"
+    return f"{scenario_id}-v{prompt_idx - 1}"
+
+
+def _still_running(batch_id: str):
+    print(f"\nBatch {batch_id} is still running on the provider.")
+    print(f"Rerun with --batch-id {batch_id} to collect it instead of resubmitting.")
+
+
+async def _batch_openai(
+    client: AsyncOpenAI,
+    requests: Dict[str, str],
+    model: str,
+    poll_seconds: float,
+    batch_id: Optional[str] = None,
+) -> Dict[str, str]:
+    """Run prompts keyed by custom_id through the OpenAI Batch API.
+
+    If batch_id is given, that already-submitted batch is polled instead of
+    submitting requests. Returns the response text for each request that
+    succeeded.
+    """
+    if batch_id is not None:
+        batch = await client.batches.retrieve(batch_id)
+        print(f"Collecting OpenAI batch {batch.id}")
+    else:
+        lines = "".join(
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": _openai_params(prompt, model),
             })
+            + "\n"
+            for custom_id, prompt in requests.items()
+        )
+        batch_file = await client.files.create(
+            file=("batch.jsonl", lines.encode()), purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        print(f"Submitted OpenAI batch {batch.id} with {len(requests)} request(s)")
+
+    try:
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_seconds)
+            batch = await client.batches.retrieve(batch.id)
+    except asyncio.CancelledError:
+        _still_running(batch.id)
+        raise
+    print(f"Batch {batch.id} finished: {batch.status}")
 
+    responses = {}
+    # Expired and cancelled batches still return whatever completed
+    if batch.output_file_id is None:
+        return responses
+    content = await client.files.content(batch.output_file_id)
+    for line in content.text.splitlines():
+        row = json.loads(line)
+        response = row.get("response")
+        if row.get("error") is None and response and response["status_code"] == 200:
+            responses[row["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return responses
+
+
+async def _batch_anthropic(
+    client: AsyncAnthropic,
+    requests: Dict[str, str],
+    model: str,
+    poll_seconds: float,
+    batch_id: Optional[str] = None,
+) -> Dict[str, str]:
+    """Run prompts keyed by custom_id through the Anthropic Message Batches API.
+
+    If batch_id is given, that already-submitted batch is polled instead of
+    submitting requests. Returns the response text for each request that
+    succeeded.
+    """
+    if batch_id is not None:
+        batch = await client.messages.batches.retrieve(batch_id)
+        print(f"Collecting Anthropic batch {batch.id}")
+    else:
+        batch = await client.messages.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": _anthropic_params(prompt, model)}
+                for custom_id, prompt in requests.items()
+            ]
+        )
+        print(f"Submitted Anthropic batch {batch.id} with {len(requests)} request(s)")
+
+    try:
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_seconds)
+            batch = await client.messages.batches.retrieve(batch.id)
+    except asyncio.CancelledError:
+        _still_running(batch.id)
+        raise
+    counts = batch.request_counts
+    print(f"Batch {batch.id} finished: {counts.succeeded} succeeded, {counts.errored} errored")
+
+    responses = {}
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            responses[entry.custom_id] = entry.result.message.content[0].text
+    return responses
+
+
+async def run_batch_evals(
+    scenario_paths: List[Path],
+    model: str,
+    include_adversarial: bool = False,
+    on_result: Optional[Callable[[dict], None]] = None,
+    poll_seconds: float = BATCH_POLL_SECONDS,
+    cache: Optional[ResponseCache] = None,
+    batch_id: Optional[str] = None,
+) -> List[dict]:
+    """Submit every prompt for scenario_paths as one provider batch job and wait for it.
+
+    Batch jobs are billed at a discount but can take up to 24 hours. Prompts
+    found in cache are left out of the job. Pass batch_id to collect a job
+    submitted by an earlier, interrupted run instead of submitting a new one;
+    responses it holds for scenarios outside scenario_paths are ignored. A
+    scenario with any failed request is left out of the results, so a later
+    --resume run picks it up. on_result is called for each completed
+    scenario, as in run_evals.
+    """
+    prepared = []
+    requests = {}
+    responses = {}
+    cached_ids = set()
+    for path in scenario_paths:
+        scenario, variants, prompts = _prepare_scenario(path, include_adversarial)
+        prepared.append((path, scenario, variants, prompts))
+        for j, prompt in enumerate(prompts):
+            custom_id = _custom_id(scenario["id"], j)
+            cached = cache.get(prompt, model) if cache is not None else None
+            if cached is not None:
+                responses[custom_id] = cached
+                cached_ids.add(custom_id)
+            else:
+                requests[custom_id] = prompt
+
+    if requests:
+        batch = _batch_openai if _provider(model) == "openai" else _batch_anthropic
+        async with make_client(model) as client:
+            batch_responses = await batch(client, requests, model, poll_seconds, batch_id)
+        batch_responses = {c: r for c, r in batch_responses.items() if c in requests}
+        if cache is not None:
+            for custom_id, response in batch_responses.items():
+                cache.put(requests[custom_id], model, response)
+        responses.update(batch_responses)
+
+    results = []
+    for path, scenario, variants, prompts in prepared:
+        ids = [_custom_id(scenario["id"], j) for j in range(len(prompts))]
+        if not all(custom_id in responses for custom_id in ids):
+            print(f"  Batch requests failed for {scenario['id']}; rerun with --resume to retry")
+            continue
+        result = _assemble_result(
+            path,
+            scenario,
+            model,
+            variants,
+            prompts,
+            [responses[c] for c in ids],
+            [c in cached_ids for c in ids],
+        )
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
     return results
 
 
-def save_results(results: dict | list, output_dir: Path, filename: str):
-    """Save results to JSON file."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / filename
+def load_completed_ids(path: Path) -> Set[str]:
+    """Return the scenario IDs already recorded in a JSONL results file.
 
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2)
+    Unparseable lines are ignored, so those scenarios are simply run again.
+    """
+    done = set()
+    if not path.exists():
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["scenario_id"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+    return done
 
-    print(f"Results saved to: {output_path}")
+
+def recorded_model(path: Path) -> Optional[str]:
+    """Return the model named by the first parseable row of a JSONL results file."""
+    if not path.exists():
+        return None
+    with open(path) as f:
+        for line in f:
+            try:
+                return json.loads(line)["model"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+    return None
+
+
+def drop_partial_line(path: Path):
+    """Truncate a final line left incomplete by an interrupted write."""
+    if not path.exists():
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            f.truncate(end)
+
+
+def append_result(fh: TextIO, result: dict):
+    """Append one result to a JSONL file and flush it to disk."""
+    fh.write(json.dumps(result) + "\n")
+    fh.flush()
+    os.fsync(fh.fileno())
 
 
 def main():
@@ -219,6 +909,48 @@ def main():
         action="store_true",
         help="Include adversarial variants",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of API calls in flight at once (default: 4)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        help="Requests-per-minute budget (default: learned from rate-limit headers)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        help="Tokens-per-minute budget (default: learned from rate-limit headers)",
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        help="Append to an existing JSONL results file, skipping scenarios it already holds",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit all prompts as one discounted provider batch job and wait for it (can take hours)",
+    )
+    parser.add_argument(
+        "--batch-id",
+        type=str,
+        help="Collect an already-submitted batch job instead of submitting a new one (implies --batch)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached model responses (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API, neither reading nor writing cached responses",
+    )
 
     args = parser.parse_args()
 
@@ -228,31 +960,84 @@ def main():
     if args.scenario and args.module:
         parser.error("Specify only one of --scenario or --module")
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
     # Determine scenarios to run
     if args.scenario:
         scenarios = [args.scenario]
     else:
         scenarios = get_scenarios_for_module(args.module)
 
+    if args.resume:
+        output_path = args.resume
+        model = recorded_model(output_path)
+        if model is not None and model != args.model:
+            parser.error(f"{output_path} holds results for {model}, not {args.model}")
+        drop_partial_line(output_path)
+        done = load_completed_ids(output_path)
+        scenarios = [p for p in scenarios if p.stem not in done]
+        print(f"Resuming {output_path}: {len(done)} scenario(s) already complete")
+    else:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        if args.scenario:
+            filename = f"{args.scenario.stem}_{args.model}_{timestamp}.jsonl"
+        else:
+            filename = f"{args.module}_{args.model}_{timestamp}.jsonl"
+        args.output.mkdir(parents=True, exist_ok=True)
+        output_path = args.output / filename
+
     print(f"Running {len(scenarios)} scenario(s) against {args.model}")
     print(f"Adversarial variants: {'Yes' if args.adversarial else 'No'}")
     print()
 
-    all_results = []
-    for scenario_path in scenarios:
-        print(f"Evaluating: {scenario_path.name}")
-        result = run_single_eval(scenario_path, args.model, args.adversarial)
-        all_results.append(result)
+    # Each result is appended as soon as its scenario finishes, so an
+    # interrupted run keeps everything completed so far.
+    with open(output_path, "a") as fh:
+        on_result = functools.partial(append_result, fh)
+        cache = None if args.no_cache else ResponseCache(args.cache_dir)
+        if args.batch or args.batch_id:
+            runner = run_batch_evals(
+                scenarios,
+                args.model,
+                args.adversarial,
+                on_result,
+                cache=cache,
+                batch_id=args.batch_id,
+            )
+        else:
+            runner = run_evals(
+                scenarios,
+                args.model,
+                args.adversarial,
+                args.concurrency,
+                args.rpm,
+                args.tpm,
+                on_result=on_result,
+                cache=cache,
+            )
+        try:
+            results = asyncio.run(runner)
+        except KeyboardInterrupt:
+            print(f"\nInterrupted. Completed scenarios are in {output_path}")
+            print(f"Rerun with --resume {output_path} to finish.")
+            return 1
+        except Exception:
+            print(f"\nRun failed. Completed scenarios are in {output_path}")
+            print(f"Rerun with --resume {output_path} to finish.")
+            raise
 
-    # Save results
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    if args.scenario:
-        filename = f"{args.scenario.stem}_{args.model}_{timestamp}.json"
-    else:
-        filename = f"{args.module}_{args.model}_{timestamp}.json"
+    evals = [e for r in results for e in [r["base_eval"], *r["adversarial_evals"]]]
+    if cache is not None:
+        print(f"\n{sum(e['cached'] for e in evals)} of {len(evals)} response(s) served from cache")
 
-    save_results(all_results, args.output, filename)
+    failed = len(scenarios) - len(results)
+    if failed:
+        print(f"\n{failed} scenario(s) failed and were not saved.")
+        print(f"Rerun with --resume {output_path} to retry them.")
+        return 1
 
+    print(f"Results saved to: {output_path}")
     print()
     print("Evaluation complete. Results saved.")
     print("Next step: Review responses and add scores using the grading rubric.")
@@ -260,4 +1045,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Pre-build the pickle sidecars that run_eval.load_scenario reads.
+
+Run after checking out or editing scenarios (e.g. as a CI/build step) so
+later evaluation runs load every scenario without parsing YAML.
+
+Usage:
+    # Every module under evals/
+    python -m src.warm_cache
+
+    # Selected modules
+    python -m src.warm_cache --module 07_probabilistic_judgment_and_calibration
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from src.run_eval import cache_scenario, get_scenarios_for_module
+
+EVALS_DIR = Path(__file__).parent.parent / "evals"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write <scenario>.yaml.pkl cache sidecars")
+    parser.add_argument(
+        "--module",
+        action="append",
+        help="Module to warm (repeatable; default: every module with scenarios)",
+    )
+
+    args = parser.parse_args()
+
+    modules = args.module or sorted(
+        d.name for d in EVALS_DIR.iterdir() if (d / "scenarios").is_dir()
+    )
+
+    count = 0
+    for module in modules:
+        for path in get_scenarios_for_module(module):
+            cache_scenario(path)
+            count += 1
+
+    print(f"Cached {count} scenario(s) from {len(modules)} module(s)")
+
+
+if __name__ == "__main__":
+    main()
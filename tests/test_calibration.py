@@ -6,7 +6,10 @@ import pytest
 
 from src.calibration import (
     brier_score,
+    brier_score_batch,
+    calibration_report,
     expected_calibration_error,
+    log_loss_batch,
     log_loss_score,
     parse_probability_from_response,
     score_probability_quality,
@@ -71,6 +74,38 @@ class TestLogLoss:
             log_loss_score(1.5, 1)
 
 
+class TestBatchScores:
+    """Tests for vectorized Brier and log loss."""
+
+    PROBS = [1.0, 0.0, 0.7, 0.5, 0.2]
+    OUTCOMES = [1, 1, 1, 0, 0]
+
+    def test_brier_matches_scalar(self):
+        batch = brier_score_batch(self.PROBS, self.OUTCOMES)
+        expected = [brier_score(p, o) for p, o in zip(self.PROBS, self.OUTCOMES, strict=True)]
+        assert batch == pytest.approx(expected)
+
+    def test_log_loss_matches_scalar(self):
+        batch = log_loss_batch(self.PROBS, self.OUTCOMES)
+        expected = [log_loss_score(p, o) for p, o in zip(self.PROBS, self.OUTCOMES, strict=True)]
+        assert batch == pytest.approx(expected)
+
+    def test_empty(self):
+        assert len(brier_score_batch([], [])) == 0
+
+    def test_range_validation(self):
+        with pytest.raises(ValueError):
+            brier_score_batch([0.5, 1.5], [0, 1])
+
+    def test_outcome_validation(self):
+        with pytest.raises(ValueError):
+            log_loss_batch([0.5], [2])
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValueError):
+            brier_score_batch([0.5], [0, 1])
+
+
 class TestECE:
     """Tests for Expected Calibration Error."""
 
@@ -101,6 +136,23 @@ class TestECE:
         with pytest.raises(ValueError):
             expected_calibration_error([0.5], [0, 1])
 
+    def test_bin_assignment(self):
+        # Lower edges are inclusive; p == 1.0 lands in the last bin
+        probs = [0.0, 0.1, 0.25, 0.99, 1.0]
+        outcomes = [0, 0, 1, 1, 1]
+        ece, bins = expected_calibration_error(probs, outcomes)
+        assert [b["count"] for b in bins] == [1, 1, 1, 0, 0, 0, 0, 0, 0, 2]
+        assert bins[9]["avg_confidence"] == pytest.approx(0.995)
+        assert bins[9]["avg_accuracy"] == 1.0
+
+    def test_matches_binned_definition(self):
+        probs = [0.05, 0.15, 0.15, 0.45, 0.55, 0.85, 0.95]
+        outcomes = [0, 0, 1, 0, 1, 1, 1]
+        ece, _ = expected_calibration_error(probs, outcomes)
+        # Per-bin |accuracy - confidence| weighted by bin share
+        expected = (0.05 + 2 * 0.35 + 0.45 + 0.45 + 0.15 + 0.05) / 7
+        assert ece == pytest.approx(expected, abs=1e-4)
+
 
 class TestScoreProbabilityQuality:
     """Tests for probability quality scoring."""
@@ -166,6 +218,12 @@ class TestParseResponse:
         assert abs(result["range_low"] - 0.70) < 0.01
         assert abs(result["range_high"] - 0.80) < 0.01
 
+    def test_range_format_en_dash(self):
+        result = parse_probability_from_response("The probability is 70–80%")
+        assert result is not None
+        assert abs(result["range_low"] - 0.70) < 0.01
+        assert abs(result["range_high"] - 0.80) < 0.01
+
     def test_range_format_to(self):
         result = parse_probability_from_response("I'd say 65% to 75% is defensible")
         assert result is not None
@@ -185,7 +243,54 @@ class TestParseResponse:
         result = parse_probability_from_response("The market dropped 100% of its gains")
         assert result is None
 
+    def test_range_preferred_over_earlier_percentage(self):
+        result = parse_probability_from_response("I'd say 30%, within a 25-35% band")
+        assert result is not None
+        assert abs(result["range_low"] - 0.25) < 0.01
+        assert abs(result["point_estimate"] - 0.30) < 0.01
+
+    def test_invalid_range_falls_back_to_percentage(self):
+        # "80% to 60%" is not a valid range, so its first percentage is used
+        result = parse_probability_from_response("Odds fell from 80% to 60% after the CRL")
+        assert result is not None
+        assert result["range_low"] is None
+        assert abs(result["point_estimate"] - 0.80) < 0.01
+
     def test_decimal_format(self):
         result = parse_probability_from_response("probability of 0.75 for this outcome")
         assert result is not None
         assert abs(result["point_estimate"] - 0.75) < 0.01
+
+
+class TestCalibrationReport:
+    """Tests for aggregate calibration reporting."""
+
+    def test_aggregates(self):
+        predictions = [
+            {"scenario_id": "a", "predicted_prob": 0.75, "ground_truth_range": (0.70, 0.85),
+             "expressed_range": (0.70, 0.80)},
+            {"scenario_id": "b", "predicted_prob": 0.30, "ground_truth_range": (0.70, 0.85),
+             "expressed_range": None},
+        ]
+        report = calibration_report(predictions)
+        assert report["num_scenarios"] == 2
+        assert report["avg_calibration_score"] == 1.5  # (3 + 0) / 2
+        assert report["range_acknowledgment_rate"] == 0.5
+        assert [s["scenario_id"] for s in report["per_scenario"]] == ["a", "b"]
+
+    def test_percentage_ranges_rejected(self):
+        with pytest.raises(ValueError, match="ground_truth_range"):
+            calibration_report([
+                {"scenario_id": "a", "predicted_prob": 0.75, "ground_truth_range": (70, 85)},
+            ])
+        with pytest.raises(ValueError, match="expressed_range"):
+            calibration_report([
+                {"scenario_id": "a", "predicted_prob": 0.75, "ground_truth_range": (0.7, 0.85),
+                 "expressed_range": (70, 80)},
+            ])
+
+    def test_empty(self):
+        report = calibration_report([])
+        assert report["num_scenarios"] == 0
+        assert report["avg_calibration_score"] == 0
+        assert report["per_scenario"] == []
@@ -0,0 +1,79 @@
+"""Tests for replaying cached grades."""
+
+from __future__ import annotations
+
+from src.grade import apply_grades, export_grades, load_grades, load_results, save_results
+
+
+def make_results():
+    return [
+        {
+            "scenario_id": "06_01_etf_flow_correlation",
+            "base_eval": {"response": "...", "scores": None, "notes": ""},
+            "adversarial_evals": [
+                {"variant_id": "06_01_ADV_01", "response": "...", "scores": None, "notes": ""},
+            ],
+        },
+        {
+            "scenario_id": "06_02_glp1_medtech_correlation",
+            "base_eval": {"response": "...", "scores": None, "notes": ""},
+            "adversarial_evals": [],
+        },
+    ]
+
+
+SCORES = {
+    "classification": 3,
+    "fragility": 2,
+    "risk_treatment": 2,
+    "critical_error": "pass",
+    "total": 7,
+}
+
+
+class TestApplyGrades:
+    """Tests for merging a grades sidecar into results."""
+
+    def test_round_trip(self, tmp_path):
+        graded = make_results()
+        graded[0]["base_eval"].update(scores=SCORES, notes="solid")
+        graded[0]["adversarial_evals"][0].update(scores=SCORES, notes="held up")
+        sidecar = tmp_path / "grades.jsonl"
+        export_grades(graded, sidecar)
+
+        results = make_results()
+        applied = apply_grades(results, load_grades(sidecar))
+
+        assert applied == 2
+        assert results[0]["base_eval"]["scores"] == SCORES
+        assert results[0]["base_eval"]["notes"] == "solid"
+        assert results[0]["adversarial_evals"][0]["notes"] == "held up"
+
+    def test_ungraded_left_untouched(self, tmp_path):
+        sidecar = tmp_path / "grades.jsonl"
+        sidecar.write_text(
+            '{"scenario_id": "06_02_glp1_medtech_correlation", "scores": {"total": 5}}\n\n'
+        )
+        results = make_results()
+        applied = apply_grades(results, load_grades(sidecar))
+
+        assert applied == 1
+        assert results[0]["base_eval"]["scores"] is None
+        assert results[1]["base_eval"]["scores"] == {"total": 5}
+
+
+class TestResultsFiles:
+    """Tests for reading and writing results files."""
+
+    def test_jsonl_round_trip(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        save_results(make_results(), path)
+
+        assert len(path.read_text().splitlines()) == 2
+        assert load_results(path) == make_results()
+
+    def test_json_array_still_supported(self, tmp_path):
+        path = tmp_path / "results.json"
+        save_results(make_results(), path)
+
+        assert load_results(path) == make_results()
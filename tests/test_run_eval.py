@@ -0,0 +1,460 @@
+"""Tests for the evaluation runner."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.run_eval
+from src.run_eval import (
+    SYSTEM_PROMPT,
+    RateLimiter,
+    ResponseCache,
+    _TokenBucket,
+    build_prompt,
+    call_anthropic,
+    cache_scenario,
+    get_scenarios_for_module,
+    load_scenario,
+    main,
+    prompt_sections,
+    run_batch_evals,
+    run_evals,
+)
+
+SCENARIO = (
+    Path(__file__).parent.parent
+    / "evals"
+    / "06_spurious_correlation_and_fragility"
+    / "scenarios"
+    / "06_01_etf_flow_correlation.yaml"
+)
+OTHER_SCENARIO = SCENARIO.with_name("06_02_glp1_medtech_correlation.yaml")
+
+
+def sdk_client(client_cls, handler, **kwargs):
+    """A real SDK client whose HTTP requests are answered by handler(request).
+
+    Uses whichever httpx flavour (httpx or the httpx2 fork) the installed
+    SDK is built on.
+    """
+    base = type(client_cls(api_key="test")._client)
+    name = next(c.__module__ for c in base.__mro__ if c.__module__.startswith("httpx"))
+    httpx = importlib.import_module(name.split(".")[0])
+    transport = httpx.MockTransport(lambda request: httpx.Response(**handler(request)))
+    return client_cls(
+        api_key="test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=transport),
+        **kwargs,
+    )
+
+
+def chat_completion(text):
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4-turbo",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": text},
+            }
+        ],
+    }
+
+
+class TestScenarioCache:
+    """Tests for the SCENARIO_CACHE pickle sidecar."""
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SCENARIO_CACHE", raising=False)
+        path = Path(shutil.copy(SCENARIO, tmp_path))
+        load_scenario(path)
+        assert not (tmp_path / (path.name + ".pkl")).exists()
+
+    def test_sidecar_reused_then_invalidated(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCENARIO_CACHE", "1")
+        path = Path(shutil.copy(SCENARIO, tmp_path))
+        first = load_scenario(path)
+        assert (tmp_path / (path.name + ".pkl")).exists()
+        assert load_scenario(path) == first
+
+        path.write_text(path.read_text().replace(first["id"], "edited_id", 1))
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        assert load_scenario(path)["id"] == "edited_id"
+
+    def test_warm_sidecar_read_without_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SCENARIO_CACHE", raising=False)
+        path = Path(shutil.copy(SCENARIO, tmp_path))
+        expected = cache_scenario(path)
+
+        def fail(_):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(src.run_eval, "_parse_scenario", fail)
+        assert load_scenario(path) == expected
+
+
+class TestBuildPrompt:
+    """Tests for splicing adversarial variants into the prompt."""
+
+    def test_variant_between_context_and_task(self):
+        scenario = load_scenario(SCENARIO)
+        variant = scenario["adversarial_variants"][0]
+        sections = prompt_sections(scenario)
+
+        prompt = build_prompt(scenario, variant, sections)
+
+        assert prompt == build_prompt(scenario, variant)
+        assert prompt.index("## Context") < prompt.index("## Additional Information")
+        assert prompt.index("## Additional Information") < prompt.index("## Task")
+        assert build_prompt(scenario, sections=sections) == "\n\n".join(sections)
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache."""
+
+    def test_hit_after_put(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        assert cache.get("prompt", "gpt-4-turbo") is None
+
+        cache.put("prompt", "gpt-4-turbo", "response")
+
+        assert cache.get("prompt", "gpt-4-turbo") == "response"
+        assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+    def test_key_covers_model_and_prompt(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.put("prompt", "gpt-4-turbo", "response")
+
+        assert cache.get("prompt", "gpt-4o") is None
+        assert cache.get("other prompt", "gpt-4-turbo") is None
+
+
+def anthropic_message(text):
+    return {
+        "id": "msg_test",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-test",
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 1, "output_tokens": 1},
+    }
+
+
+class TestTokenBucket:
+    """Tests for the rate limiter's per-minute buckets."""
+
+    def test_unlimited_never_waits(self):
+        bucket = _TokenBucket()
+        assert bucket.wait_time(10**9, now=0.0) == 0.0
+
+    def test_waits_for_refill(self):
+        bucket = _TokenBucket(60)  # one per second
+        bucket.updated = 0.0
+        bucket.take(60)
+
+        assert bucket.wait_time(30, now=0.0) == pytest.approx(30)
+        assert bucket.wait_time(30, now=30.0) == 0.0
+
+    def test_wait_capped_at_full_bucket(self):
+        bucket = _TokenBucket(60)
+        bucket.updated = 0.0
+        bucket.take(60)
+
+        assert bucket.wait_time(1000, now=0.0) == pytest.approx(60)
+
+    def test_sync_adopts_limit_and_remaining(self):
+        bucket = _TokenBucket()
+        bucket.sync("100", "40")
+        assert (bucket.capacity, bucket.level) == (100, 40)
+
+        # Never assume more than the server says remains
+        bucket.sync(None, "90")
+        assert bucket.level == 40
+        bucket.sync("200", None)
+        assert (bucket.capacity, bucket.level) == (200, 40)
+
+    def test_explicit_limit_caps_server_limit(self):
+        limiter = RateLimiter(rpm=10)
+        limiter.update({"x-ratelimit-limit-requests": "10000", "x-ratelimit-remaining-requests": "9999"})
+        bucket = limiter.buckets["requests"]
+        assert (bucket.capacity, bucket.level) == (10, 10)
+
+        # A server limit below the flag still lowers the budget
+        limiter.update({"x-ratelimit-limit-requests": "5"})
+        assert (bucket.capacity, bucket.level) == (5, 5)
+
+        bucket.updated = 0.0
+        bucket.take(5)
+        assert bucket.wait_time(1, now=0.0) == pytest.approx(12)  # refills at 5/min
+
+
+class TestCallAnthropic:
+    """Tests for direct Anthropic calls on a mocked client."""
+
+    def test_returns_text_and_syncs_limiter(self):
+        anthropic = pytest.importorskip("anthropic")
+        headers = {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "10",
+        }
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            return {"status_code": 200, "json": anthropic_message("60%"), "headers": headers}
+
+        limiter = RateLimiter()
+
+        async def call():
+            async with sdk_client(anthropic.AsyncAnthropic, handler) as client:
+                return await call_anthropic("prompt", "claude-test", limiter, client)
+
+        assert asyncio.run(call()) == "60%"
+        assert sent[0]["system"][0]["text"] == SYSTEM_PROMPT
+        assert sent[0]["messages"] == [{"role": "user", "content": "prompt"}]
+        assert limiter.buckets["requests"].capacity == 50
+        assert limiter.buckets["requests"].level == 10
+
+
+class TestRunEvals:
+    """Tests for the concurrent runner on a mocked OpenAI client."""
+
+    def test_failed_scenario_left_out(self, monkeypatch, capsys):
+        openai = pytest.importorskip("openai")
+        failing = load_scenario(OTHER_SCENARIO)["observed_relationship"].strip()
+
+        def handler(request):
+            prompt = json.loads(request.content)["messages"][-1]["content"]
+            if failing in prompt:
+                error = {"message": "bad request", "type": "invalid_request_error"}
+                return {"status_code": 400, "json": {"error": error}}
+            return {"status_code": 200, "json": chat_completion("70-80%")}
+
+        monkeypatch.setattr(
+            src.run_eval, "make_client", lambda model: sdk_client(openai.AsyncOpenAI, handler)
+        )
+        saved = []
+        results = asyncio.run(
+            run_evals(
+                [OTHER_SCENARIO, SCENARIO],
+                "gpt-4-turbo",
+                include_adversarial=True,
+                on_result=saved.append,
+            )
+        )
+
+        assert [r["scenario_id"] for r in results] == [SCENARIO.stem]
+        assert saved == results
+        assert results[0]["base_eval"]["response"] == "70-80%"
+        variants = load_scenario(SCENARIO)["adversarial_variants"]
+        assert len(results[0]["adversarial_evals"]) == len(variants)
+        assert f"Failed: {OTHER_SCENARIO.name}" in capsys.readouterr().out
+
+    def test_cache_hits_flagged(self, tmp_path, monkeypatch):
+        openai = pytest.importorskip("openai")
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return {"status_code": 200, "json": chat_completion("70-80%")}
+
+        monkeypatch.setattr(
+            src.run_eval, "make_client", lambda model: sdk_client(openai.AsyncOpenAI, handler)
+        )
+        cache = ResponseCache(tmp_path)
+
+        def run():
+            (result,) = asyncio.run(
+                run_evals([SCENARIO], "gpt-4-turbo", include_adversarial=True, cache=cache)
+            )
+            return [result["base_eval"]] + result["adversarial_evals"]
+
+        first = run()
+        sent = len(calls)
+        second = run()
+
+        assert [e["cached"] for e in first] == [False] * len(first)
+        assert [e["cached"] for e in second] == [True] * len(second)
+        assert len(calls) == sent == len(first)
+        assert [e["response"] for e in second] == [e["response"] for e in first]
+
+    def test_fully_cached_run_needs_no_client(self, tmp_path, monkeypatch):
+        cache = ResponseCache(tmp_path)
+        _, _, prompts = src.run_eval._prepare_scenario(SCENARIO, True)
+        for prompt in prompts:
+            cache.put(prompt, "gpt-4-turbo", "cached answer")
+
+        def no_client(model):
+            raise AssertionError("client created for a fully cached run")
+
+        monkeypatch.setattr(src.run_eval, "make_client", no_client)
+        (result,) = asyncio.run(
+            run_evals([SCENARIO], "gpt-4-turbo", include_adversarial=True, cache=cache)
+        )
+
+        evals = [result["base_eval"]] + result["adversarial_evals"]
+        assert [e["response"] for e in evals] == ["cached answer"] * len(prompts)
+        assert all(e["cached"] for e in evals)
+        # A --resume with nothing left to run needs no client either
+        assert asyncio.run(run_evals([], "gpt-4-turbo")) == []
+
+
+class TestRunBatchEvals:
+    """Tests for the batch runner on a mocked OpenAI Batch API."""
+
+    def batch_api(self, status, failed_id=None):
+        """Handler for a batch that reports status; failed_id's request errors."""
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, request.url.path))
+            batch = {
+                "id": "batch-1",
+                "object": "batch",
+                "endpoint": "/v1/chat/completions",
+                "input_file_id": "file-in",
+                "completion_window": "24h",
+                "created_at": 0,
+                "status": "in_progress",
+            }
+            if request.url.path == "/v1/files":
+                self.submitted = re.findall(rb'"custom_id": "([^"]+)"', request.content)
+                return {"status_code": 200, "json": {"id": "file-in", "object": "file"}}
+            if request.url.path == "/v1/batches":
+                return {"status_code": 200, "json": batch}
+            if request.url.path == "/v1/batches/batch-1":
+                batch.update(status=status, output_file_id="file-out")
+                return {"status_code": 200, "json": batch}
+            rows = []
+            for custom_id in self.ids:
+                if custom_id == failed_id:
+                    row = {"response": {"status_code": 400, "body": {}}, "error": None}
+                else:
+                    row = {"response": {"status_code": 200, "body": chat_completion(custom_id)}}
+                rows.append(json.dumps({"custom_id": custom_id, **row}))
+            return {"status_code": 200, "content": "\n".join(rows).encode()}
+
+        return handler, calls
+
+    @pytest.fixture(autouse=True)
+    def client(self, monkeypatch):
+        openai = pytest.importorskip("openai")
+        self.ids = []
+        for path in (OTHER_SCENARIO, SCENARIO):
+            variants = load_scenario(path)["adversarial_variants"]
+            self.ids += [f"{path.stem}-base"] + [f"{path.stem}-v{j}" for j in range(len(variants))]
+
+        def use(handler):
+            monkeypatch.setattr(
+                src.run_eval, "make_client", lambda model: sdk_client(openai.AsyncOpenAI, handler)
+            )
+
+        return use
+
+    def test_failed_request_leaves_scenario_out(self, client, capsys):
+        handler, _ = self.batch_api("completed", failed_id=f"{OTHER_SCENARIO.stem}-v0")
+        client(handler)
+        saved = []
+        results = asyncio.run(
+            run_batch_evals(
+                [OTHER_SCENARIO, SCENARIO], "gpt-4-turbo", True, saved.append, poll_seconds=0
+            )
+        )
+
+        assert [s.decode() for s in self.submitted] == self.ids
+        assert [r["scenario_id"] for r in results] == [SCENARIO.stem]
+        assert saved == results
+        assert results[0]["base_eval"]["response"] == f"{SCENARIO.stem}-base"
+        assert results[0]["adversarial_evals"][-1]["response"] == self.ids[-1]
+        assert not results[0]["base_eval"]["cached"]
+        assert f"Batch requests failed for {OTHER_SCENARIO.stem}" in capsys.readouterr().out
+
+    def test_batch_id_collects_without_resubmitting(self, client):
+        handler, calls = self.batch_api("completed")
+        client(handler)
+        results = asyncio.run(
+            run_batch_evals([SCENARIO], "gpt-4-turbo", True, poll_seconds=0, batch_id="batch-1")
+        )
+
+        assert ("POST", "/v1/batches") not in calls
+        assert ("POST", "/v1/files") not in calls
+        assert [r["scenario_id"] for r in results] == [SCENARIO.stem]
+        assert results[0]["base_eval"]["response"] == f"{SCENARIO.stem}-base"
+
+    def test_interrupt_reports_running_batch(self, client, capsys):
+        handler, _ = self.batch_api("in_progress")
+        client(handler)
+
+        async def interrupt():
+            task = asyncio.ensure_future(
+                run_batch_evals([SCENARIO], "gpt-4-turbo", poll_seconds=0.01)
+            )
+            await asyncio.sleep(0.1)
+            task.cancel()
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(interrupt())
+        out = capsys.readouterr().out
+        assert "Batch batch-1 is still running" in out
+        assert "--batch-id batch-1" in out
+
+
+class TestResume:
+    """Tests for --resume on a mocked OpenAI client."""
+
+    MODULE = SCENARIO.parent.parent.name
+
+    def run_main(self, monkeypatch, *args):
+        monkeypatch.setattr(sys, "argv", ["run_eval", "--module", self.MODULE, "--no-cache", *args])
+        return main()
+
+    def test_resume_after_truncated_write(self, tmp_path, monkeypatch):
+        openai = pytest.importorskip("openai")
+        done = json.dumps({"scenario_id": OTHER_SCENARIO.stem, "model": "gpt-4-turbo"})
+        output = tmp_path / "results.jsonl"
+        output.write_text(done + "\n" + '{"scenario_id": "06_01_etf_fl')
+        skipped = load_scenario(OTHER_SCENARIO)["observed_relationship"].strip()
+        prompts = []
+
+        def handler(request):
+            prompts.append(json.loads(request.content)["messages"][-1]["content"])
+            return {"status_code": 200, "json": chat_completion("70-80%")}
+
+        monkeypatch.setattr(
+            src.run_eval, "make_client", lambda model: sdk_client(openai.AsyncOpenAI, handler)
+        )
+        assert self.run_main(monkeypatch, "--model", "gpt-4-turbo", "--resume", str(output)) is None
+
+        lines = output.read_text().splitlines()
+        assert lines[0] == done
+        ids = [json.loads(line)["scenario_id"] for line in lines]
+        assert sorted(ids) == sorted(p.stem for p in get_scenarios_for_module(self.MODULE))
+        assert prompts and not any(skipped in prompt for prompt in prompts)
+
+    def test_model_mismatch_rejected(self, tmp_path, monkeypatch, capsys):
+        output = tmp_path / "results.jsonl"
+        output.write_text(json.dumps({"scenario_id": OTHER_SCENARIO.stem, "model": "claude-test"}) + "\n{")
+        before = output.read_text()
+
+        with pytest.raises(SystemExit) as exc:
+            self.run_main(monkeypatch, "--model", "gpt-4-turbo", "--resume", str(output))
+
+        assert exc.value.code == 2
+        assert "holds results for claude-test, not gpt-4-turbo" in capsys.readouterr().err
+        assert output.read_text() == before
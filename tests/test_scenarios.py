@@ -1,11 +1,18 @@
 """Tests for scenario YAML validation."""
 
 import os
+from functools import cache
 from pathlib import Path
 
+import fastjsonschema
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 REPO_ROOT = Path(__file__).parent.parent
 EVALS_DIR = REPO_ROOT / "evals"
@@ -41,103 +48,103 @@ REQUIRED_ANCHOR_ANSWERS = [
 ]
 
 
+# Structure every scenario must have. Anchor answer responses must be longer
+# than 100 characters.
+SCHEMA = {
+    "type": "object",
+    "required": REQUIRED_SCENARIO_FIELDS,
+    "properties": {
+        "relationship_type": {"enum": VALID_RELATIONSHIP_TYPES},
+        "grading_axes": {"type": "object", "required": REQUIRED_GRADING_AXES},
+        "anchor_answers": {
+            "type": "object",
+            "required": REQUIRED_ANCHOR_ANSWERS,
+            "additionalProperties": {
+                "type": "object",
+                "required": ["response"],
+                "properties": {"response": {"type": "string", "minLength": 101}},
+            },
+        },
+    },
+}
+
+_validate = fastjsonschema.compile(SCHEMA)
+
+
+@cache
+def _load_cached(path_str, mtime_ns, size):
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load(path):
+    """Parse a scenario YAML once per session, re-reading it if the file changes.
+
+    The cached dict is shared between tests, so callers must not mutate it.
+    """
+    st = path.stat()
+    return _load_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def get_scenario_files():
-    """Find all scenario YAML files in the evals directory."""
+    """Find all scenario YAML files in the evals directory (evals/<module>/scenarios/*.yaml)."""
     scenario_files = []
-    for module_dir in EVALS_DIR.iterdir():
-        if module_dir.is_dir():
-            scenarios_dir = module_dir / "scenarios"
-            if scenarios_dir.exists():
-                for yaml_file in scenarios_dir.glob("*.yaml"):
-                    scenario_files.append(yaml_file)
+    for dirpath, dirnames, filenames in os.walk(EVALS_DIR):
+        dirnames.sort()
+        if os.path.basename(dirpath) != "scenarios":
+            continue
+        dirnames.clear()
+        scenarios_dir = Path(dirpath)
+        if scenarios_dir.parent.parent != EVALS_DIR:
+            continue
+        scenario_files.extend(scenarios_dir / f for f in sorted(filenames) if f.endswith(".yaml"))
     return scenario_files
 
 
-@pytest.fixture
-def scenario_files():
-    """Fixture providing all scenario files."""
-    return get_scenario_files()
-
+# Collected once at import; every parametrized test and fixture shares it
+_SCENARIO_FILES = get_scenario_files()
 
-class TestScenarioStructure:
-    """Tests for scenario YAML structure and required fields."""
+MODULE_07_DIR = EVALS_DIR / "07_probabilistic_judgment_and_calibration" / "scenarios"
+MODULE_07_SCENARIOS = [
+    "07_01_fda_binary_outcome.yaml",
+    "07_02_recession_probability.yaml",
+    "07_03_earnings_beat_miss.yaml",
+    "07_04_merger_completion.yaml",
+    "07_05_interest_rate_direction.yaml",
+]
+_MODULE_07_FILES = [MODULE_07_DIR / s for s in MODULE_07_SCENARIOS]
 
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_scenario_is_valid_yaml(self, scenario_file):
-        """Test that scenario files are valid YAML."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
-        assert data is not None, f"{scenario_file} is empty or invalid YAML"
-
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_scenario_has_required_fields(self, scenario_file):
-        """Test that scenarios have all required top-level fields."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
-
-        for field in REQUIRED_SCENARIO_FIELDS:
-            assert field in data, f"{scenario_file} missing required field: {field}"
-
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_relationship_type_is_valid(self, scenario_file):
-        """Test that relationship_type is one of the valid options."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
-
-        rel_type = data.get("relationship_type")
-        assert rel_type in VALID_RELATIONSHIP_TYPES, (
-            f"{scenario_file} has invalid relationship_type: {rel_type}. "
-            f"Must be one of: {VALID_RELATIONSHIP_TYPES}"
-        )
 
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_grading_axes_complete(self, scenario_file):
-        """Test that all required grading axes are present."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+@pytest.fixture(scope="session", params=_SCENARIO_FILES, ids=lambda p: p.name)
+def scenario(request):
+    """Fixture providing (path, parsed YAML) for each scenario file, parsed once."""
+    return request.param, load(request.param)
 
-        grading_axes = data.get("grading_axes", {})
-        for axis in REQUIRED_GRADING_AXES:
-            assert axis in grading_axes, (
-                f"{scenario_file} missing grading axis: {axis}"
-            )
 
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_anchor_answers_complete(self, scenario_file):
-        """Test that all required anchor answers are present."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+@pytest.fixture
+def scenario_files():
+    """Fixture providing all scenario files."""
+    return list(_SCENARIO_FILES)
 
-        anchor_answers = data.get("anchor_answers", {})
-        for answer_type in REQUIRED_ANCHOR_ANSWERS:
-            assert answer_type in anchor_answers, (
-                f"{scenario_file} missing anchor answer: {answer_type}"
-            )
 
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_anchor_answers_have_response(self, scenario_file):
-        """Test that each anchor answer has a response field."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+class TestScenarioStructure:
+    """Tests for scenario YAML structure and required fields."""
 
-        anchor_answers = data.get("anchor_answers", {})
-        for answer_type, answer in anchor_answers.items():
-            assert "response" in answer, (
-                f"{scenario_file} anchor answer '{answer_type}' missing 'response' field"
-            )
-            assert len(answer["response"]) > 100, (
-                f"{scenario_file} anchor answer '{answer_type}' response seems too short"
-            )
+    def test_schema(self, scenario):
+        """Test that scenarios have the required fields, axes and anchor answers."""
+        scenario_file, data = scenario
+        try:
+            _validate(data)
+        except fastjsonschema.JsonSchemaException as e:
+            pytest.fail(f"{scenario_file}: {e.message}")
 
 
 class TestScenarioContent:
     """Tests for scenario content quality."""
 
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_id_matches_filename(self, scenario_file):
+    def test_id_matches_filename(self, scenario):
         """Test that scenario ID matches the filename."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+        scenario_file, data = scenario
 
         expected_id = scenario_file.stem
         actual_id = data.get("id")
@@ -145,11 +152,9 @@ class TestScenarioContent:
             f"Scenario ID '{actual_id}' doesn't match filename '{expected_id}'"
         )
 
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_failing_answer_has_critical_error_explanation(self, scenario_file):
+    def test_failing_answer_has_critical_error_explanation(self, scenario):
         """Test that failing answers explain the critical error."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+        scenario_file, data = scenario
 
         failing = data.get("anchor_answers", {}).get("failing", {})
         notes = failing.get("notes", "")
@@ -159,11 +164,9 @@ class TestScenarioContent:
             f"{scenario_file} failing answer notes should explain the critical error"
         )
 
-    @pytest.mark.parametrize("scenario_file", get_scenario_files())
-    def test_has_adversarial_variants(self, scenario_file):
+    def test_has_adversarial_variants(self, scenario):
         """Test that scenarios have adversarial variants."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+        scenario_file, data = scenario
 
         variants = data.get("adversarial_variants", [])
         assert len(variants) >= 2, (
@@ -198,60 +201,25 @@ class TestScenarioConsistency:
 class TestModule07Scenarios:
     """Tests specific to Module 07 probabilistic judgment scenarios."""
 
-    MODULE_07_DIR = EVALS_DIR / "07_probabilistic_judgment_and_calibration" / "scenarios"
-    EXPECTED_SCENARIOS = [
-        "07_01_fda_binary_outcome.yaml",
-        "07_02_recession_probability.yaml",
-        "07_03_earnings_beat_miss.yaml",
-        "07_04_merger_completion.yaml",
-        "07_05_interest_rate_direction.yaml",
-    ]
-
     def test_module_07_has_all_scenarios(self):
         """Test that Module 07 has all expected scenarios."""
-        for scenario in self.EXPECTED_SCENARIOS:
-            assert (self.MODULE_07_DIR / scenario).exists(), (
+        for scenario in MODULE_07_SCENARIOS:
+            assert (MODULE_07_DIR / scenario).exists(), (
                 f"Expected scenario not found: {scenario}"
             )
 
-    @pytest.mark.parametrize(
-        "scenario_file",
-        [
-            EVALS_DIR / "07_probabilistic_judgment_and_calibration" / "scenarios" / s
-            for s in [
-                "07_01_fda_binary_outcome.yaml",
-                "07_02_recession_probability.yaml",
-                "07_03_earnings_beat_miss.yaml",
-                "07_04_merger_completion.yaml",
-                "07_05_interest_rate_direction.yaml",
-            ]
-        ],
-    )
+    @pytest.mark.parametrize("scenario_file", _MODULE_07_FILES)
     def test_module_07_scenarios_have_calibration_axes(self, scenario_file):
         """Test that Module 07 scenarios include calibration scoring data."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+        data = load(scenario_file)
         assert "calibration_axes" in data, (
             f"{scenario_file.name} missing calibration_axes (required for Module 07)"
         )
 
-    @pytest.mark.parametrize(
-        "scenario_file",
-        [
-            EVALS_DIR / "07_probabilistic_judgment_and_calibration" / "scenarios" / s
-            for s in [
-                "07_01_fda_binary_outcome.yaml",
-                "07_02_recession_probability.yaml",
-                "07_03_earnings_beat_miss.yaml",
-                "07_04_merger_completion.yaml",
-                "07_05_interest_rate_direction.yaml",
-            ]
-        ],
-    )
+    @pytest.mark.parametrize("scenario_file", _MODULE_07_FILES)
     def test_module_07_calibration_axes_have_ground_truth_range(self, scenario_file):
         """Test that calibration axes include valid ground truth probability range."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+        data = load(scenario_file)
         cal = data.get("calibration_axes", {})
         assert "probability_estimate" in cal, (
             f"{scenario_file.name} calibration_axes missing probability_estimate"
@@ -268,23 +236,10 @@ class TestModule07Scenarios:
             f"{scenario_file.name} ground_truth_range must be valid percentages"
         )
 
-    @pytest.mark.parametrize(
-        "scenario_file",
-        [
-            EVALS_DIR / "07_probabilistic_judgment_and_calibration" / "scenarios" / s
-            for s in [
-                "07_01_fda_binary_outcome.yaml",
-                "07_02_recession_probability.yaml",
-                "07_03_earnings_beat_miss.yaml",
-                "07_04_merger_completion.yaml",
-                "07_05_interest_rate_direction.yaml",
-            ]
-        ],
-    )
+    @pytest.mark.parametrize("scenario_file", _MODULE_07_FILES)
     def test_module_07_task_requests_probability(self, scenario_file):
         """Test that Module 07 tasks ask for explicit probability estimates."""
-        with open(scenario_file) as f:
-            data = yaml.safe_load(f)
+        data = load(scenario_file)
         task = data.get("task", "").lower()
         assert "probability" in task or "probabilities" in task, (
             f"{scenario_file.name} task should request explicit probability estimates"
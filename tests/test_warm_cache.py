@@ -0,0 +1,36 @@
+"""Tests for the scenario sidecar warming CLI."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from pathlib import Path
+
+import src.warm_cache
+from src.run_eval import get_scenarios_for_module, load_scenario
+
+MODULE = "06_spurious_correlation_and_fragility"
+
+
+class TestWarmCache:
+    """Tests for python -m src.warm_cache."""
+
+    def test_writes_sidecar_per_scenario(self, tmp_path, monkeypatch, capsys):
+        copies = [Path(shutil.copy(p, tmp_path)) for p in get_scenarios_for_module(MODULE)]
+        modules = []
+
+        def scenarios_for(module):
+            modules.append(module)
+            return copies
+
+        monkeypatch.setattr(src.warm_cache, "get_scenarios_for_module", scenarios_for)
+        monkeypatch.setattr(sys, "argv", ["warm_cache", "--module", MODULE])
+        monkeypatch.delenv("SCENARIO_CACHE", raising=False)
+        src.warm_cache.main()
+
+        assert modules == [MODULE]
+        for path in copies:
+            sidecar = path.with_name(path.name + ".pkl")
+            assert sidecar.exists()
+            assert load_scenario(path)["id"] == path.stem
+        assert f"Cached {len(copies)} scenario(s) from 1 module(s)" in capsys.readouterr().out